@@ -44,7 +44,6 @@ ASDF_DATA_DIR = os.path.expanduser(
 )
 ASDF_INSTALLED = shutil.which("asdf") is not None
 IS_64BIT_OS = None
-SYSTEM_ARCH = platform.architecture()[0]
 
 if sys.maxsize > 2**32:
     IS_64BIT_OS = platform.machine() == "AMD64"
@@ -61,6 +60,14 @@ Set to **5** by default.
 """
 
 
+def __getattr__(name):
+    # Resolve ``SYSTEM_ARCH`` on first access rather than at import time.
+    if name == "SYSTEM_ARCH":
+        system_arch = globals()["SYSTEM_ARCH"] = platform.architecture()[0]
+        return system_arch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def set_asdf_paths():
     if ASDF_INSTALLED:
         python_versions = os.path.join(ASDF_DATA_DIR, "installs", "python")
@@ -246,15 +246,11 @@ class PathEntry(BaseModel):
         :return: A list of :class:`~pythonfinder.models.PathEntry` instances matching the version requested.
         """
 
-        call_method = "find_all_python_versions" if self.is_dir else "find_python_version"
-
-        def sub_finder(obj):
-            return getattr(obj, call_method)(major, minor, patch, pre, dev, arch, name)
-
+        args = (major, minor, patch, pre, dev, arch, name)
         if not self.is_dir:
-            return sub_finder(self)
+            return self.find_python_version(*args)
 
-        unnested = [sub_finder(path) for path in expand_paths(self)]
+        unnested = [path.find_all_python_versions(*args) for path in expand_paths(self)]
 
         def version_sort(path_entry):
             return path_entry.as_python.version_sort
@@ -304,8 +300,8 @@ class PathEntry(BaseModel):
                 and version_matcher(entry.py_version)
             )
         ]
-        results = sorted(matching_pythons, key=lambda r: (r[1], r[0]), reverse=True)
-        return next(iter(r[0] for r in results if r is not None), None)
+        result = max(matching_pythons, key=lambda r: (r[1], r[0]), default=None)
+        return result[0] if result is not None else None
 
     def _filter_children(self) -> Iterator[Path]:
         if not os.access(str(self.path), os.R_OK):
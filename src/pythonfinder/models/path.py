@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import errno
-import operator
 import os
 import sys
 from collections import ChainMap, defaultdict
@@ -369,8 +368,7 @@ class SystemPath(FinderBaseModel):
         :returns: List[PathEntry]
         """
 
-        sub_which = operator.methodcaller("which", executable)
-        filtered = (sub_which(self.get_path(k)) for k in self.path_order)
+        filtered = (self.get_path(k).which(executable) for k in self.path_order)
         return list(filtered)
 
     def which(self, executable) -> PathEntry | None:
@@ -382,8 +380,7 @@ class SystemPath(FinderBaseModel):
         :returns: :class:`~pythonfinder.models.PathEntry` object.
         """
 
-        sub_which = operator.methodcaller("which", executable)
-        filtered = (sub_which(self.get_path(k)) for k in self.path_order)
+        filtered = (self.get_path(k).which(executable) for k in self.path_order)
         return next(iter(f for f in filtered if f is not None), None)
 
     def _filter_paths(self, finder) -> Iterator:
@@ -454,6 +451,9 @@ class SystemPath(FinderBaseModel):
         def alternate_sub_finder(obj):
             return obj.find_all_python_versions(None, None, None, None, None, None, name)
 
+        def version_sort_key(entry):
+            return entry.as_python.version_sort
+
         major, minor, patch, name = split_version_and_name(major, minor, patch, name)
         if major and minor and patch:
             _tuple_pre = pre if pre is not None else False
@@ -471,9 +471,14 @@ class SystemPath(FinderBaseModel):
                     if found_version:
                         return found_version
 
-        ver = next(iter(self.get_pythons(sub_finder)), None)
+        # Only the best match is needed, so avoid sorting every candidate.
+        ver = max(self._get_all_pythons(sub_finder), key=version_sort_key, default=None)
         if not ver and name and not (minor or patch or pre or dev or arch or major):
-            ver = next(iter(self.get_pythons(alternate_sub_finder)), None)
+            ver = max(
+                self._get_all_pythons(alternate_sub_finder),
+                key=version_sort_key,
+                default=None,
+            )
 
         if ver:
             if ver.as_python.version_tuple[:5] in self.python_version_dict:
@@ -19,9 +19,9 @@ from typing import (
 )
 
 from packaging.version import Version
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 
-from ..environment import ASDF_DATA_DIR, PYENV_ROOT, SYSTEM_ARCH
+from ..environment import ASDF_DATA_DIR, PYENV_ROOT
 from ..exceptions import InvalidPythonVersion
 from ..utils import (
     ensure_path,
@@ -29,7 +29,6 @@ from ..utils import (
     get_python_version,
     guess_company,
     is_in_path,
-    looks_like_python,
     parse_asdf_version_order,
     parse_pyenv_version_order,
     parse_python_version,
@@ -39,6 +38,25 @@ from .mixins import PathEntry
 
 logger = logging.getLogger(__name__)
 
+#: Parsed version dictionaries keyed by the raw version string
+_PARSE_CACHE: dict[str, dict[str, str | int | Version]] = {}
+#: Architectures reported by :func:`platform.architecture` keyed by executable
+_ARCH_CACHE: dict[str, str] = {}
+#: Fields which invalidate the cached :attr:`PythonVersion.version_sort` and
+#: :attr:`PythonVersion.version_tuple` when set
+_VERSION_FIELDS = frozenset(
+    (
+        "major",
+        "minor",
+        "patch",
+        "is_prerelease",
+        "is_postrelease",
+        "is_devrelease",
+        "is_debug",
+        "company",
+    )
+)
+
 
 class PythonFinder(PathEntry):
     root: Path
@@ -56,6 +74,8 @@ class PythonFinder(PathEntry):
     #: Versions discovered in the specified paths
     _versions: Dict = Field(default_factory=lambda: defaultdict())
     pythons_ref: Dict = Field(default_factory=lambda: defaultdict())
+    #: Cached ``(version path, bin dir entry)`` pairs, set to ``None`` to rescan
+    version_bases_ref: Optional[List] = None
 
     class Config:
         validate_assignment = True
@@ -76,12 +96,28 @@ class PythonFinder(PathEntry):
     def is_asdf(self) -> bool:
         return is_in_path(str(self.root), ASDF_DATA_DIR)
 
+    def _iter_version_paths(self) -> Iterator[Path]:
+        base, _, pattern = self.version_glob_path.rpartition("/")
+        if pattern != "*" or any(c in base for c in "*?["):
+            for p in self.root.glob(self.version_glob_path):
+                if not (p.parent.name == "envs" or p.name == "envs") and p.is_dir():
+                    yield p
+            return
+        # Plain ``<dir>/*`` patterns only need a single directory listing, and
+        # the cached ``DirEntry`` type information saves a stat per version.
+        base_dir = self.root / base if base else self.root
+        if base_dir.name == "envs":
+            return
+        try:
+            with os.scandir(base_dir) as it:
+                entries = [e for e in it if e.name != "envs" and e.is_dir()]
+        except OSError:
+            return
+        for entry in entries:
+            yield Path(entry.path)
+
     def get_version_order(self) -> list[Path]:
-        version_paths = [
-            p
-            for p in self.root.glob(self.version_glob_path)
-            if not (p.parent.name == "envs" or p.name == "envs")
-        ]
+        version_paths = list(self._iter_version_paths())
         versions = {v.name: v for v in version_paths}
         version_order = []
         if self.is_pyenv:
@@ -92,14 +128,10 @@ class PythonFinder(PathEntry):
             version_order = [
                 versions[v] for v in parse_asdf_version_order() if v in versions
             ]
-        for version in version_order:
-            if version in version_paths:
-                version_paths.remove(version)
-        if version_order:
-            version_order += version_paths
-        else:
-            version_order = version_paths
-        return version_order
+        if not version_order:
+            return version_paths
+        ordered = set(version_order)
+        return version_order + [p for p in version_paths if p not in ordered]
 
     def get_bin_dir(self, base) -> Path:
         if isinstance(base, str):
@@ -114,9 +146,14 @@ class PythonFinder(PathEntry):
         return py_version
 
     def _iter_version_bases(self) -> Iterator[tuple[Path, PathEntry]]:
+        if self.version_bases_ref is None:
+            self.version_bases_ref = list(self._gen_version_bases())
+        yield from self.version_bases_ref
+
+    def _gen_version_bases(self) -> Iterator[tuple[Path, PathEntry]]:
         for p in self.get_version_order():
             bin_dir = self.get_bin_dir(p)
-            if bin_dir.exists() and bin_dir.is_dir():
+            if bin_dir.is_dir():
                 entry = PathEntry.create(
                     path=bin_dir.absolute(), only_python=False, name=p.name, is_root=True
                 )
@@ -165,14 +202,16 @@ class PythonFinder(PathEntry):
         return self._versions
 
     def _iter_pythons(self) -> Iterator:
+        versions = self.versions
         for path, entry, version_tuple in self._iter_versions():
-            if path.as_posix() in self._pythons:
-                yield self._pythons[path.as_posix()]
-            elif version_tuple not in self.versions:
+            path_key = path.as_posix()
+            if path_key in self._pythons:
+                yield self._pythons[path_key]
+            elif version_tuple not in versions:
                 for python in entry.find_all_python_versions():
                     yield python
             else:
-                yield self.versions[version_tuple]
+                yield versions[version_tuple]
 
     @validator("paths", pre=True, always=True)
     def get_paths(cls, v) -> list[PathEntry]:
@@ -238,18 +277,16 @@ class PythonFinder(PathEntry):
         :return: A list of :class:`~pythonfinder.models.PathEntry` instances matching the version requested.
         """
 
-        call_method = "find_all_python_versions" if self.is_dir else "find_python_version"
-
-        def sub_finder(path):
-            return getattr(path, call_method)(major, minor, patch, pre, dev, arch, name)
-
+        args = (major, minor, patch, pre, dev, arch, name)
         if not any([major, minor, patch, name]):
             pythons = [
                 next(iter(py for py in base.find_all_python_versions()), None)
                 for _, base in self._iter_version_bases()
             ]
+        elif self.is_dir:
+            pythons = [path.find_all_python_versions(*args) for path in self.paths]
         else:
-            pythons = [sub_finder(path) for path in self.paths]
+            pythons = [path.find_python_version(*args) for path in self.paths]
 
         pythons = expand_paths(pythons, True)
 
@@ -290,14 +327,16 @@ class PythonFinder(PathEntry):
         def version_sort(path_entry):
             return path_entry.as_python.version_sort
 
-        unnested = [sub_finder(self.roots[path]) for path in self.roots]
-        unnested = [
-            p
-            for p in unnested
-            if p is not None and p.is_python and p.as_python is not None
-        ]
-        paths = sorted(list(unnested), key=version_sort, reverse=True)
-        return next(iter(p for p in paths if p is not None), None)
+        unnested = [sub_finder(root) for root in self.roots.values()]
+        return max(
+            (
+                p
+                for p in unnested
+                if p is not None and p.is_python and p.as_python is not None
+            ),
+            key=version_sort,
+            default=None,
+        )
 
     def which(self, name) -> PathEntry | None:
         """Search in this path for an executable.
@@ -326,6 +365,8 @@ class PythonVersion(FinderBaseModel):
     executable: Optional[Union[str, WindowsPath, Path]] = None
     company: Optional[str] = None
     name: Optional[str] = None
+    _version_sort: Optional[Tuple] = PrivateAttr(default=None)
+    _version_tuple: Optional[Tuple] = PrivateAttr(default=None)
 
     class Config:
         validate_assignment = True
@@ -334,27 +375,43 @@ class PythonVersion(FinderBaseModel):
         include_private_attributes = True
         # keep_untouched = (cached_property,)
 
-    def __getattribute__(self, key):
-        result = super().__getattribute__(key)
-        if key in ["minor", "patch"] and result is None:
-            executable = None
-            if self.executable:
-                executable = self.executable
-            elif self.comes_from:
-                executable = self.comes_from.path.as_posix()
-            if executable is not None:
-                if not isinstance(executable, str):
-                    executable = executable.as_posix()
-                instance_dict = self.parse_executable(executable)
-                for k in instance_dict.keys():
-                    try:
-                        super().__getattribute__(k)
-                    except AttributeError:
-                        continue
-                    else:
-                        setattr(self, k, instance_dict[k])
-                result = instance_dict.get(key)
-        return result
+    def copy(self, **kwargs) -> PythonVersion:
+        # Private attributes are carried over as-is, which would leave the
+        # cached version keys stale when ``update`` changes a version field.
+        copied = super().copy(**kwargs)
+        object.__setattr__(copied, "_version_sort", None)
+        object.__setattr__(copied, "_version_tuple", None)
+        return copied
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _VERSION_FIELDS:
+            object.__setattr__(self, "_version_sort", None)
+            object.__setattr__(self, "_version_tuple", None)
+
+    def _update_from_executable(self) -> None:
+        executable = None
+        if self.executable:
+            executable = self.executable
+        elif self.comes_from:
+            executable = self.comes_from.path.as_posix()
+        if executable is None:
+            return
+        if not isinstance(executable, str):
+            executable = executable.as_posix()
+        instance_dict = self.parse_executable(executable)
+        self.minor = instance_dict.pop("minor", None)
+        self.patch = instance_dict.pop("patch", None)
+        self.update_metadata(instance_dict)
+
+    @property
+    def _is_resolved(self) -> bool:
+        # Whether minor and patch are known without querying the executable, so
+        # version keys derived from them are safe to cache.
+        return (
+            self.__dict__.get("minor") is not None
+            and self.__dict__.get("patch") is not None
+        )
 
     @property
     def version_sort(self) -> tuple[int, int, int | None, int, int]:
@@ -368,6 +425,8 @@ class PythonVersion(FinderBaseModel):
         postrelease.  ``(0, 3, 7, 3, 2)`` represents a non-core python release, e.g. by
         a repackager of python like Continuum.
         """
+        if self._version_sort is not None:
+            return self._version_sort
         company_sort = 1 if (self.company and self.company == "PythonCore") else 0
         release_sort = 2
         if self.is_postrelease:
@@ -378,13 +437,16 @@ class PythonVersion(FinderBaseModel):
             release_sort = 0
         elif self.is_debug:
             release_sort = 1
-        return (
+        version_sort = (
             company_sort,
             self.major,
             self.minor,
             self.patch if self.patch else 0,
             release_sort,
         )
+        if self._is_resolved:
+            self._version_sort = version_sort
+        return version_sort
 
     @property
     def version_tuple(self) -> tuple[int, int, int, bool, bool, bool]:
@@ -394,7 +456,9 @@ class PythonVersion(FinderBaseModel):
         :return: A tuple describing the python version meetadata contained.
         """
 
-        return (
+        if self._version_tuple is not None:
+            return self._version_tuple
+        version_tuple = (
             self.major,
             self.minor,
             self.patch,
@@ -402,6 +466,9 @@ class PythonVersion(FinderBaseModel):
             self.is_devrelease,
             self.is_debug,
         )
+        if self._is_resolved:
+            self._version_tuple = version_tuple
+        return version_tuple
 
     def matches(
         self,
@@ -414,27 +481,25 @@ class PythonVersion(FinderBaseModel):
         debug: bool = False,
         python_name: str | None = None,
     ) -> bool:
-        result = False
-        if arch:
-            own_arch = self.get_architecture()
-            if arch.isdigit():
-                arch = f"{arch}bit"
-        if (
+        if not (
             (major is None or self.major == major)
             and (minor is None or self.minor == minor)
             and (patch is None or self.patch == patch)
             and (pre is None or self.is_prerelease == pre)
             and (dev is None or self.is_devrelease == dev)
-            and (arch is None or own_arch == arch)
             and (debug is None or self.is_debug == debug)
             and (
                 python_name is None
-                or (python_name and self.name)
-                and (self.name == python_name or self.name.startswith(python_name))
+                or (python_name and self.name and self.name.startswith(python_name))
             )
         ):
-            result = True
-        return result
+            return False
+        # Checked last as it is by far the most expensive predicate.
+        if arch:
+            if arch.isdigit():
+                arch = f"{arch}bit"
+            return self.get_architecture() == arch
+        return True
 
     def as_major(self) -> PythonVersion:
         self.minor = None
@@ -491,21 +556,33 @@ class PythonVersion(FinderBaseModel):
 
         if version is None:
             raise TypeError("Must pass a value to parse!")
-        version_dict = parse_python_version(str(version))
-        if not version_dict:
-            raise ValueError("Not a valid python version: %r" % version)
-        return version_dict
+        version = str(version)
+        try:
+            version_dict = _PARSE_CACHE[version]
+        except KeyError:
+            version_dict = parse_python_version(version)
+            if not version_dict:
+                raise ValueError("Not a valid python version: %r" % version)
+            _PARSE_CACHE[version] = version_dict
+        # Callers update the returned dictionary in place, so hand out a copy
+        return version_dict.copy()
 
     def get_architecture(self) -> str:
         if self.architecture:
             return self.architecture
-        arch = None
         if self.comes_from is not None:
-            arch, _ = platform.architecture(self.comes_from.path.as_posix())
+            executable = self.comes_from.path.as_posix()
         elif self.executable is not None:
-            arch, _ = platform.architecture(self.executable)
-        if arch is None:
-            arch, _ = platform.architecture(sys.executable)
+            executable = str(self.executable)
+        else:
+            executable = sys.executable
+        # ``platform.architecture`` shells out to ``file`` on posix, so only
+        # ever ask once per executable.
+        try:
+            arch = _ARCH_CACHE[executable]
+        except KeyError:
+            arch, _ = platform.architecture(executable)
+            _ARCH_CACHE[executable] = arch
         self.architecture = arch
         return self.architecture
 
@@ -536,25 +613,24 @@ class PythonVersion(FinderBaseModel):
         try:
             instance_dict = cls.parse(path_name)
         except Exception:
+            instance_dict = {}
+        # Running the executable is expensive, so only do it once, whenever the
+        # name alone does not carry the full version (a missing minor implies
+        # a missing patch as well).
+        if instance_dict.get("patch") is None:
             instance_dict = cls.parse_executable(path.path.absolute().as_posix())
-        else:
-            if instance_dict.get("minor") is None and looks_like_python(path.path.name):
-                instance_dict = cls.parse_executable(path.path.absolute().as_posix())
 
         if (
             not isinstance(instance_dict.get("version"), Version)
             and not ignore_unsupported
         ):
             raise ValueError("Not a valid python path: %s" % path)
-        if instance_dict.get("patch") is None:
-            instance_dict = cls.parse_executable(path.path.absolute().as_posix())
+        executable = path.path.as_posix()
         if name is None:
             name = path_name
         if company is None:
-            company = guess_company(path.path.as_posix())
-        instance_dict.update(
-            {"comes_from": path, "name": name, "executable": path.path.as_posix()}
-        )
+            company = guess_company(executable)
+        instance_dict.update({"comes_from": path, "name": name, "executable": executable})
         return cls(**instance_dict)
 
     @classmethod
@@ -587,6 +663,8 @@ class PythonVersion(FinderBaseModel):
         :param Optional[str] company: The name of the distributing company.
         :return: An instance of a PythonVersion.
         """
+        from ..environment import SYSTEM_ARCH
+
         creation_dict = cls.parse(launcher_entry.info.version)
         base_path = ensure_path(launcher_entry.info.install_path.__getattr__(""))
         default_path = base_path / "python.exe"
@@ -620,6 +698,27 @@ class PythonVersion(FinderBaseModel):
         return cls(**kwargs)
 
 
+def _lazy_version_part(key: str) -> property:
+    def getter(self) -> int | None:
+        value = self.__dict__.get(key)
+        if value is None:
+            self._update_from_executable()
+            value = self.__dict__.get(key)
+        return value
+
+    def setter(self, val) -> None:
+        self.__dict__[key] = val
+
+    return property(getter, setter)
+
+
+# Defined after the class body: pydantic drops annotated names whose class value is
+# a property, so attaching the accessors here keeps ``minor`` and ``patch`` regular
+# fields while parsing the executable only when the stored value is missing.
+PythonVersion.minor = _lazy_version_part("minor")
+PythonVersion.patch = _lazy_version_part("patch")
+
+
 class VersionMap(FinderBaseModel):
     versions: DefaultDict[
         Tuple[int, Optional[int], Optional[int], bool, bool, bool], List[PathEntry]
@@ -642,14 +741,9 @@ class VersionMap(FinderBaseModel):
 
     def merge(self, target) -> None:
         for version, entries in target.versions.items():
-            if version not in self.versions:
-                self.versions[version] = entries
-            else:
-                current_entries = {
-                    p.path for p in self.versions[version] if version in self.versions
-                }
-                new_entries = {p.path for p in entries}
-                new_entries -= current_entries
-                self.versions[version].extend(
-                    [e for e in entries if e.path in new_entries]
-                )
+            current_entries = self.versions.setdefault(version, [])
+            if not current_entries:
+                current_entries.extend(entries)
+                continue
+            current_paths = {p.path for p in current_entries}
+            current_entries.extend(e for e in entries if e.path not in current_paths)
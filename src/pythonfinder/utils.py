@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, Iterator
 
 from packaging.version import InvalidVersion, Version
+from packaging.version import parse as parse_version
 
 from .environment import PYENV_ROOT, possibly_convert_to_windows_style_path
 from .exceptions import InvalidPythonVersion
@@ -97,8 +98,6 @@ def get_python_version(path) -> str:
 
 
 def parse_python_version(version_str: str) -> dict[str, str | int | Version]:
-    from packaging.version import parse as parse_version
-
     is_debug = False
     if version_str.endswith("-debug"):
         is_debug = True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import platform
 import re
 import tempfile
 
@@ -26,3 +27,12 @@ def test_possibly_convert_to_windows_style_path():
         expected = drive.upper() + tail.replace('/', '\\')
         revised_path = possibly_convert_to_windows_style_path(input_path)
         assert expected == revised_path
+
+
+def test_system_arch_is_computed_lazily(monkeypatch):
+    import pythonfinder.environment as environment
+
+    monkeypatch.delitem(vars(environment), "SYSTEM_ARCH", raising=False)
+    assert "SYSTEM_ARCH" not in vars(environment)
+    assert environment.SYSTEM_ARCH == platform.architecture()[0]
+    assert "SYSTEM_ARCH" in vars(environment)
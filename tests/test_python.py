@@ -98,3 +98,112 @@ def test_python_version_output_variants(monkeypatch, path, version_output, versi
 @pytest.mark.skipif(os.name == "nt", reason="Does not run on Windows")
 def test_pythonfinder(expected_python_versions, all_python_versions):
     assert sorted(expected_python_versions) == sorted(all_python_versions)
+
+
+def test_parse_returns_independent_copies():
+    first = PythonVersion.parse("3.11.4")
+    first.update({"name": "python3.11"})
+    second = PythonVersion.parse("3.11.4")
+    assert "name" not in second
+    assert second["version"] == Version("3.11.4")
+
+
+@pytest.mark.parametrize("version_glob_path", ["versions/*", "vers*/*"])
+def test_get_version_order_skips_envs_and_files(tmp_path, version_glob_path):
+    versions_dir = tmp_path / "versions"
+    for name in ("3.10.12", "3.11.4", "envs"):
+        (versions_dir / name / "bin").mkdir(parents=True)
+    (versions_dir / "README").write_text("not a version")
+    if os.name != "nt":
+        (versions_dir / "broken").symlink_to(tmp_path / "missing")
+    finder = PythonFinder.create(
+        root=tmp_path, sort_function=None, version_glob_path=version_glob_path
+    )
+    version_order = finder.get_version_order()
+    assert sorted(p.name for p in version_order) == ["3.10.12", "3.11.4"]
+
+
+def test_version_bases_are_scanned_once(tmp_path, monkeypatch):
+    (tmp_path / "versions" / "3.11.4" / "bin").mkdir(parents=True)
+    finder = PythonFinder.create(root=tmp_path, sort_function=None)
+    first = list(finder._iter_version_bases())
+    with monkeypatch.context() as m:
+        m.setattr(PythonFinder, "get_version_order", lambda self: [])
+        assert list(finder._iter_version_bases()) == first
+        finder.version_bases_ref = None
+        assert list(finder._iter_version_bases()) == []
+    assert [p.name for p, _ in first] == ["3.11.4"]
+
+
+def test_cached_version_keys_are_invalidated_on_update():
+    version = PythonVersion.create(**PythonVersion.parse("3.11.4"))
+    assert version.version_sort == (0, 3, 11, 4, 2)
+    version.company = "PythonCore"
+    version.update_metadata({"is_prerelease": True})
+    assert version.version_sort == (1, 3, 11, 4, 1)
+    assert version.version_tuple == (3, 11, 4, True, False, False)
+    assert version.version_tuple is version.version_tuple
+    version.patch = 5
+    assert version.version_tuple == (3, 11, 5, True, False, False)
+
+
+def test_matches_checks_architecture_last(monkeypatch):
+    version = PythonVersion.create(**PythonVersion.parse("3.11.4"))
+
+    def fail_architecture(self):
+        raise AssertionError("architecture should not be looked up")
+
+    with monkeypatch.context() as m:
+        m.setattr(PythonVersion, "get_architecture", fail_architecture)
+        assert not version.matches(major=2, arch="64")
+    version.architecture = "64bit"
+    assert version.matches(major=3, minor=11, arch="64")
+    assert not version.matches(major=3, arch="32bit")
+
+
+def test_dict_keeps_minor_and_patch_fields():
+    version = PythonVersion.create(**PythonVersion.parse("3.11.4"))
+    exported = version.dict()
+    assert exported["minor"] == 11
+    assert exported["patch"] == 4
+    assert "minor=11" in repr(version)
+
+
+def test_missing_minor_is_read_from_executable():
+    version = PythonVersion(major=sys.version_info[0], executable=sys.executable)
+    assert version.minor == sys.version_info[1]
+    assert version.patch == sys.version_info[2]
+    assert version.dict()["minor"] == sys.version_info[1]
+
+
+def test_cached_version_keys_survive_copy():
+    version = PythonVersion.create(**PythonVersion.parse("3.11.4"))
+    assert version.version_sort == (0, 3, 11, 4, 2)
+    assert version.copy().version_sort == (0, 3, 11, 4, 2)
+    assert version.copy(update={"patch": 5}).version_sort == (0, 3, 11, 5, 2)
+    assert version.version_tuple == (3, 11, 4, False, False, False)
+    assert version.copy().version_tuple == (3, 11, 4, False, False, False)
+    assert version.copy(update={"patch": 5}).version_tuple[:3] == (3, 11, 5)
+
+
+def test_unresolved_version_sort_is_not_cached():
+    version = PythonVersion(major=sys.version_info[0])
+    assert version.version_sort == (0, sys.version_info[0], None, 0, 2)
+    version.executable = sys.executable
+    assert version.version_sort[2:4] == sys.version_info[1:3]
+
+
+def test_unresolved_version_tuple_is_not_cached():
+    version = PythonVersion(major=sys.version_info[0])
+    assert version.version_tuple[1:3] == (None, None)
+    version.executable = sys.executable
+    assert version.version_tuple[:3] == sys.version_info[:3]
+
+
+def test_missing_minor_field_reads_as_none():
+    version = PythonVersion.create(**PythonVersion.parse("3.11.4"))
+    partial = version.copy(exclude={"minor"})
+    assert getattr(partial, "minor", None) is None
+    assert partial.version_sort == (0, 3, None, 4, 2)
+    partial.update_metadata({"minor": 12})
+    assert partial.version_tuple[:3] == (3, 12, 4)